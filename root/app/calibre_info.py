@@ -1,7 +1,8 @@
 import multiprocessing as mp
 import os
-from subprocess import call
+from subprocess import call, DEVNULL
 import ff_logging  # Custom logging module for failure logging
+import system_utils  # Shared TOML loading
 import tomllib  # Module for parsing TOML files
 
 
@@ -44,8 +45,7 @@ class CalibreInfo:
             dict: The loaded configuration.
         """
         try:
-            with open(toml_path, "rb") as file:
-                return tomllib.load(file).get("calibre", {})
+            return system_utils.load_toml(toml_path).get("calibre", {})
         except (FileNotFoundError, tomllib.TOMLDecodeError) as e:
             message = f"Failed to load configuration from {toml_path}: {e}"
             ff_logging.log_failure(message)
@@ -112,8 +112,7 @@ class CalibreInfo:
             bool: True if Calibre is installed, False otherwise.
         """
         try:
-            with open(os.devnull, "w") as nullout:
-                call(["calibredb"], stdout=nullout, stderr=nullout)
+            call(["calibredb"], stdout=DEVNULL, stderr=DEVNULL)
             return True
         except (OSError, Exception) as e:
             ff_logging.log_failure(f"Error checking Calibre installation: {e}")
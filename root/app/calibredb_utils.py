@@ -22,15 +22,16 @@ def call_calibre_db(
     Returns:
         None
     """
-    ff_logging.log_debug(
-        f'\tCalling calibredb with command: \t"{command} {fanfic_info.calibre_id if fanfic_info else ""} {calibre_info}"'
-    )
+    # Build the argument string once; it is shared by the call and both log lines
+    calibre_id = fanfic_info.calibre_id if fanfic_info else ""
+    arguments = f"{command} {calibre_id} {calibre_info}"
+    ff_logging.log_debug('\tCalling calibredb with command: \t"%s"', arguments)
     try:
         # Lock the calibre database to prevent concurrent modifications
         with calibre_info.lock:
-            # Call the calibre command line tool with the specified command\
+            # Call the calibre command line tool with the specified command
             call(
-                f"calibredb {command} {fanfic_info.calibre_id if fanfic_info else ''} {calibre_info}",
+                f"calibredb {arguments}",
                 shell=True,
                 stdin=PIPE,
                 stdout=DEVNULL,
@@ -38,9 +39,7 @@ def call_calibre_db(
             )
     except Exception as e:
         # Log any failures
-        ff_logging.log_failure(
-            f'\t"{command} {fanfic_info.calibre_id if fanfic_info else ""} {calibre_info}" failed: {e}'
-        )
+        ff_logging.log_failure(f'\t"{arguments}" failed: {e}')
 
 
 def export_story(
@@ -68,7 +68,8 @@ class CallCalibreDbTestCase(unittest.TestCase):
         call_calibre_db(command, calibre_info, fanfic_info)
 
         mock_log_debug.assert_called_once_with(
-            f'\tCalling calibredb with command: \t"{expected_command} {calibre_info}"'
+            '\tCalling calibredb with command: \t"%s"',
+            f"{expected_command} {calibre_info}",
         )
 
         if should_raise_exception:
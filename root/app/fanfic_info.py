@@ -1,4 +1,5 @@
 from subprocess import CalledProcessError, check_output, PIPE, STDOUT
+import sys
 from typing import Optional
 
 import calibre_info
@@ -15,14 +16,29 @@ class FanficInfo:
         site (str): The site where the fanfiction is hosted.
         calibre_id (Optional[str]): The ID of the story in the Calibre database, if
             it exists.
-        repeats (Optional[int]): The number of times the story has been processed.
-            Defaults to 0.
+        repeats (int): The number of times the story has been processed.
+            Defaults to 0; None is treated as 0.
         max_repeats (Optional[int]): The maximum number of times the story should
             be processed. Defaults to 10.
         behavior (Optional[str]): Custom behavior for processing the story.
         title (Optional[str]): The title of the story.
+        last_delay (float): The last retry delay in seconds, used to pick the
+            next one. Starts at 0.
     """
 
+    # Instances are created per story and pickled through the multiprocessing
+    # queues, so they carry slots instead of a per-instance __dict__
+    __slots__ = (
+        "url",
+        "calibre_id",
+        "site",
+        "repeats",
+        "max_repeats",
+        "behavior",
+        "title",
+        "last_delay",
+    )
+
     def __init__(
         self,
         url: str,
@@ -38,18 +54,37 @@ class FanficInfo:
         """
         self.url = url
         self.calibre_id = calibre_id
-        self.site = site
-        self.repeats = repeats
+        # Sites and behaviors come from small fixed sets, so share one string
+        # object per value across all instances
+        self.site = sys.intern(site)
+        self.repeats: int = repeats or 0
         self.max_repeats = max_repeats
-        self.behavior = behavior
+        self.behavior = sys.intern(behavior) if behavior else behavior
         self.title = title
+        self.last_delay = 0.0
+
+    def __setstate__(self, state: tuple) -> None:
+        """
+        Restores a pickled instance and interns its site and behavior again.
+        Unpickling creates new string objects, and the worker processes only
+        ever see unpickled copies.
+
+        Args:
+            state (tuple): The default state of a slotted object, a None
+                __dict__ followed by a dict of the slot values.
+        """
+        _, slots = state
+        for name, value in slots.items():
+            setattr(self, name, value)
+        self.site = sys.intern(self.site)
+        if self.behavior:
+            self.behavior = sys.intern(self.behavior)
 
     def increment_repeat(self) -> None:
         """
         Increments the repeat counter by one.
         """
-        if self.repeats is not None:
-            self.repeats += 1
+        self.repeats += 1
 
     def reached_maximum_repeats(self) -> bool:
         """
@@ -61,9 +96,7 @@ class FanficInfo:
             False otherwise.
         """
         return (
-            self.repeats is not None
-            and self.max_repeats is not None
-            and self.repeats >= self.max_repeats
+            self.max_repeats is not None and self.repeats >= self.max_repeats
         )
 
     def get_id_from_calibredb(
@@ -107,10 +140,13 @@ class FanficInfo:
 
         Returns:
             bool: True if the other object is a FanficInfo instance with the same URL,
-                site, and Calibre ID, False otherwise.
+                site, and Calibre ID, False otherwise. Returns NotImplemented for
+                objects of other types, so Python can try their comparison instead.
         """
-        if not isinstance(other, FanficInfo):
-            return False
+        if self is other:
+            return True
+        if type(other) is not FanficInfo:
+            return NotImplemented
         return (
             self.url == other.url
             and self.site == other.site
@@ -1,3 +1,5 @@
+import pickle
+import sys
 import unittest
 from unittest.mock import Mock, patch, mock_open, MagicMock
 from fanfic_info import FanficInfo
@@ -19,6 +21,32 @@ class TestFanficInfo(unittest.TestCase):
         self.fanfic_info.increment_repeat()
         self.assertEqual(self.fanfic_info.repeats, 1)
 
+    def test_repeats_defaults_to_zero_when_none(self):
+        fanfic = FanficInfo(url="url", site="site", repeats=None)
+        self.assertEqual(fanfic.repeats, 0)
+        fanfic.increment_repeat()
+        self.assertEqual(fanfic.repeats, 1)
+
+    def test_site_and_behavior_are_interned(self):
+        first = FanficInfo(url="a", site="".join(["ff", "net"]), behavior="force")
+        second = FanficInfo(url="b", site="".join(["ff", "net"]))
+        self.assertIs(first.site, second.site)
+        self.assertIs(first.behavior, "force")
+        self.assertIsNone(second.behavior)
+
+    def test_pickle_round_trip(self):
+        self.fanfic_info.last_delay = 120.0
+        restored = pickle.loads(pickle.dumps(self.fanfic_info))
+        self.assertEqual(restored, self.fanfic_info)
+        self.assertEqual(restored.repeats, 0)
+        self.assertEqual(restored.behavior, "update")
+        self.assertEqual(restored.title, "Test Story")
+        self.assertEqual(restored.last_delay, 120.0)
+        self.assertFalse(hasattr(restored, "__dict__"))
+        # Unpickled copies share the interned site and behavior strings
+        self.assertIs(restored.site, sys.intern("ffnet"))
+        self.assertIs(restored.behavior, sys.intern("update"))
+
     def test_reached_maximum_repeats(self):
         self.fanfic_info.repeats = 10
         self.assertTrue(self.fanfic_info.reached_maximum_repeats())
@@ -52,6 +80,10 @@ class TestFanficInfo(unittest.TestCase):
         )
         self.assertTrue(self.fanfic_info == other_fanfic_info)
 
+    def test_eq_other_type(self):
+        self.assertFalse(self.fanfic_info == "https://www.fanfiction.net/s/1234")
+        self.assertNotEqual(self.fanfic_info, None)
+
     def test_hash(self):
         fanfic_info_1 = FanficInfo(
             url="https://www.fanfiction.net/s/1234",
@@ -134,7 +134,7 @@ def signal_handler(processes, pool):
     """
 
     def handler(sig, frame):
-        ff_logging.log_failure("Terminating processes and pool...", "WARNING")
+        ff_logging.log("Terminating processes and pool...", "WARNING")
         terminate_processes(processes)
         if pool is not None:
             pool.terminate()
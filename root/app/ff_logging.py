@@ -1,6 +1,22 @@
-import ctypes
-import datetime
-from multiprocessing import Value
+import logging
+import os
+import queue
+import sys
+import threading
+import time
+import traceback
+from typing import Any
+
+# Maximum number of lines the background writer prints in one batch, unless
+# CONSOLE_LOGGING_BUFFER_SIZE overrides it; see kBufferSize at the end.
+kDefaultBufferSize = 1000
+# Seconds the background writer waits for more lines before printing a batch
+kFlushInterval = 0.02
+# Longest time, in seconds, to wait for the background writer to print what
+# is already queued
+kFlushTimeout = 5.0
+# Queued by stop_buffering to shut the background writer down
+_STOP = object()
 
 
 class bcolors:
@@ -29,54 +45,326 @@ color_map = {
     "UNDERLINE": bcolors.UNDERLINE,
 }
 
-# Initialize a shared variable for the verbose flag
-verbose = Value(ctypes.c_bool, False)
+# Logging levels for the colors that carry one; everything else is INFO
+color_levels = {
+    "WARNING": logging.WARNING,
+    "FAIL": logging.ERROR,
+}
+
+# Record extras for every color, built once at import. Unknown colors fall
+# back to bold text.
+color_extras = {name: {"color": code} for name, code in color_map.items()}
+_default_extra = {"color": bcolors.BOLD}
+_failure_extra = color_extras["FAIL"]
+_debug_extra = color_extras["OKBLUE"]
+
+
+class ColorFormatter(logging.Formatter):
+    """
+    Formats log records as a bold timestamp followed by the message in the
+    color stored on the record.
+    """
+
+    def __init__(self) -> None:
+        """
+        Initializes the formatter with an empty timestamp cache.
+        """
+        super().__init__()
+        self._second = None
+        self._prefix = ""
+
+    def format(self, record: logging.LogRecord) -> str:
+        """
+        Formats a log record. The message arguments are only merged in here, so
+        records filtered out by level are never formatted.
+
+        The timestamp only changes once a second, so the formatted prefix is
+        cached and reused for every line logged within the same second.
+
+        Args:
+            record (logging.LogRecord): The record to format.
+
+        Returns:
+            str: The formatted log line.
+        """
+        second = int(time.time())
+        if second != self._second:
+            timestamp = time.strftime(
+                "%Y-%m-%d %I:%M:%S %p", time.localtime(second)
+            )
+            self._prefix = f"{bcolors.BOLD}{timestamp}{bcolors.ENDC} - "
+            self._second = second
+        return "".join(
+            (self._prefix, record.color, record.getMessage(), bcolors.ENDC)
+        )
+
+
+class ConsoleHandler(logging.Handler):
+    """
+    Prints formatted log records to the console, either directly or in
+    batches from a background writer thread.
+    """
+
+    def __init__(self) -> None:
+        """
+        Initializes the handler in direct (unbuffered) mode.
+        """
+        super().__init__()
+        self._pending = None
+        self._writer = None
+
+    def emit(self, record: logging.LogRecord) -> None:
+        """
+        Prints a log record, or queues it for the background writer when
+        buffering is enabled. If the writer thread has stopped unexpectedly,
+        records are printed directly instead of queueing up unprinted.
+
+        Args:
+            record (logging.LogRecord): The record to print.
+        """
+        try:
+            line = self.format(record)
+            if self._pending is None or not self._writer.is_alive():
+                self._write(f"{line}\n")
+            else:
+                self._pending.put(line)
+        except Exception:
+            self.handleError(record)
+
+    def start_buffering(self) -> None:
+        """
+        Starts the background writer for this process, if it isn't running.
+        """
+        with self.lock:
+            if self._writer is not None or kBufferSize <= 0:
+                return
+            self._pending = queue.SimpleQueue()
+            self._writer = threading.Thread(
+                target=self._write_batches, args=(self._pending,), daemon=True
+            )
+            self._writer.start()
+
+    def stop_buffering(self) -> None:
+        """
+        Prints everything still queued, stops the background writer, and
+        returns to printing each record directly.
+
+        The handler lock is held throughout, so records logged from other
+        threads meanwhile wait and are printed after the queued ones.
+        """
+        with self.lock:
+            if self._writer is None:
+                return
+            self._pending.put(_STOP)
+            self._writer.join(kFlushTimeout)
+            self._pending = None
+            self._writer = None
+
+    def flush(self) -> None:
+        """
+        Blocks until every record queued so far has been printed, or for at
+        most kFlushTimeout seconds.
+        """
+        with self.lock:
+            if self._writer is None or not self._writer.is_alive():
+                return
+            printed = threading.Event()
+            self._pending.put(printed)
+        printed.wait(kFlushTimeout)
+
+    def reset_after_fork(self) -> None:
+        """
+        Returns a forked child to direct mode. The writer thread doesn't
+        survive the fork, and the parent still prints its own queued lines.
+        """
+        self._pending = None
+        self._writer = None
+
+    @staticmethod
+    def _write(text: str, flush: bool = False) -> None:
+        """
+        Writes text to stdout. The text is encoded once and written to the
+        binary buffer in a single call, falling back to print for streams
+        without one.
+
+        Writing to the buffer bypasses the line buffering of a console
+        stream, so the buffer is also flushed whenever the stream is line
+        buffered.
+
+        Args:
+            text (str): The text to write, including trailing newlines.
+            flush (bool, optional): Whether to flush the stream afterwards.
+                Defaults to False.
+        """
+        stream = sys.stdout
+        buffer = getattr(stream, "buffer", None)
+        if buffer is None:
+            print(text, end="", file=stream, flush=flush)
+            return
+        buffer.write(text.encode("utf-8", "replace"))
+        if flush or getattr(stream, "line_buffering", False):
+            buffer.flush()
+
+    @staticmethod
+    def _report_write_error() -> None:
+        """
+        Reports a failed batch write on stderr, the way handleError reports a
+        failed direct write.
+        """
+        if logging.raiseExceptions and sys.stderr:
+            try:
+                sys.stderr.write("--- Logging error ---\n")
+                traceback.print_exc(file=sys.stderr)
+            except OSError:
+                pass
+
+    @staticmethod
+    def _write_batches(pending: queue.SimpleQueue) -> None:
+        """
+        Background writer loop. Collects queued lines for up to kFlushInterval
+        seconds, or kBufferSize lines, and prints them with a single call.
+        A failed write is reported and the loop carries on, so later lines
+        and flushes are still served.
+
+        Args:
+            pending (queue.SimpleQueue): Queued lines, flush events, and the
+                stop marker.
+        """
+        while True:
+            item = pending.get()
+            batch = []
+            deadline = time.monotonic() + kFlushInterval
+            while isinstance(item, str):
+                batch.append(item)
+                timeout = deadline - time.monotonic()
+                if len(batch) >= kBufferSize or timeout <= 0:
+                    item = None
+                    break
+                try:
+                    item = pending.get(timeout=timeout)
+                except queue.Empty:
+                    item = None
+
+            if batch:
+                try:
+                    ConsoleHandler._write("\n".join(batch) + "\n", flush=True)
+                except Exception:
+                    ConsoleHandler._report_write_error()
+            if isinstance(item, threading.Event):
+                item.set()
+            elif item is _STOP:
+                return
+
+
+logger = logging.getLogger("AutomatedFanfic")
+logger.setLevel(logging.INFO)
+logger.propagate = False
+_handler = ConsoleHandler()
+_handler.setFormatter(ColorFormatter())
+logger.addHandler(_handler)
+os.register_at_fork(after_in_child=_handler.reset_after_fork)
 
 
 def set_verbose(value: bool) -> None:
     """
-    Sets the verbose flag to the given value.
+    Sets the verbose flag to the given value, enabling or disabling debug
+    messages.
 
     Args:
         value (bool): The value to set the verbose flag to.
     """
-    verbose.value = value
+    logger.setLevel(logging.DEBUG if value else logging.INFO)
+
+
+def set_buffered(value: bool) -> None:
+    """
+    Enables or disables background console writing for the current process.
+
+    When enabled, log calls only format their line and queue it. A daemon
+    thread prints queued lines in batches. Only enable this in processes that
+    won't fork afterwards.
+
+    Args:
+        value (bool): True to write from a background thread, False to print
+            each line directly.
+    """
+    if value:
+        _handler.start_buffering()
+    else:
+        _handler.stop_buffering()
 
 
-def log(msg: str, color: str = None) -> None:
+def flush() -> None:
+    """
+    Blocks until every line logged so far has been printed.
+    """
+    _handler.flush()
+
+
+def log(msg: str, color: str = None, *args: Any) -> None:
     """
     Logs a message to the console with the specified color.
 
     Args:
-        msg (str): The message to log.
+        msg (str): The message to log. May contain %-style placeholders for
+            `args`.
         color (str, optional): The color name to use for the message. Defaults to
             None, which results in bold text.
+        *args (Any): Values merged into `msg` with %-formatting, only once the
+            message is actually emitted.
     """
-
-    # Use the specified color or default to bold
-    using_col = color_map.get(color, bcolors.BOLD)
-    # Format the current timestamp
-    timestamp = datetime.datetime.now().strftime("%Y-%m-%d %I:%M:%S %p")
-    # Print the formatted log message
-    print(f"{bcolors.BOLD}{timestamp}{bcolors.ENDC} - {using_col}{msg}{bcolors.ENDC}")
+    logger.log(
+        color_levels.get(color, logging.INFO),
+        msg,
+        *args,
+        extra=color_extras.get(color, _default_extra),
+    )
 
 
-def log_failure(msg: str) -> None:
+def log_failure(msg: str, *args: Any) -> None:
     """
     Logs a failure message in red.
 
     Args:
         msg (str): The failure message to log.
+        *args (Any): Values merged into `msg` with %-formatting.
     """
-    log(msg, "FAIL")
+    logger.error(msg, *args, extra=_failure_extra)
 
 
-def log_debug(msg: str) -> None:
+def log_debug(msg: str, *args: Any) -> None:
     """
-    Logs a debug message in blue.
+    Logs a debug message in blue. The message is only formatted when verbose
+    logging is enabled.
 
     Args:
         msg (str): The debug message to log.
+        *args (Any): Values merged into `msg` with %-formatting.
     """
-    if verbose.value:
-        log(msg, "OKBLUE")
+    logger.debug(msg, *args, extra=_debug_extra)
+
+
+def _read_buffer_size() -> int:
+    """
+    Reads the background writer's batch size from CONSOLE_LOGGING_BUFFER_SIZE.
+    Setting it to 0 disables background writing entirely. A value that isn't
+    an integer is reported and the default is used instead.
+
+    Returns:
+        int: The maximum number of lines printed in one batch.
+    """
+    value = os.environ.get("CONSOLE_LOGGING_BUFFER_SIZE")
+    if value is None:
+        return kDefaultBufferSize
+    try:
+        return int(value)
+    except ValueError:
+        log_failure(
+            "Invalid CONSOLE_LOGGING_BUFFER_SIZE %r, using %d",
+            value,
+            kDefaultBufferSize,
+        )
+        return kDefaultBufferSize
+
+
+kBufferSize = _read_buffer_size()
@@ -1,4 +1,5 @@
-from typing import NamedTuple
+import io
+from typing import NamedTuple, Optional
 import unittest
 from unittest.mock import patch
 
@@ -68,13 +69,191 @@ class TestLogFunction(unittest.TestCase):
         ]
     )
     @freeze_time("2021-01-01 12:00:00")
-    @patch("builtins.print")
-    def test_log_header(self, name, message, color, code, mock_print):
+    @patch("sys.stdout")
+    def test_log_header(self, name, message, color, code, mock_stdout):
         ff_logging.log(message, color)
-        mock_print.assert_called_once_with(
-            f"\x1b[1m2021-01-01 12:00:00 PM\x1b[0m - \x1b[{code}m{message}\x1b[0m"
+        mock_stdout.buffer.write.assert_called_once_with(
+            f"\x1b[1m2021-01-01 12:00:00 PM\x1b[0m - \x1b[{code}m{message}\x1b[0m\n".encode()
         )
 
+    @freeze_time("2021-01-01 12:00:00")
+    @patch("sys.stdout")
+    def test_log_formats_arguments(self, mock_stdout):
+        ff_logging.log("Waiting %d minutes for %s", "WARNING", 5, "url")
+        mock_stdout.buffer.write.assert_called_once_with(
+            "\x1b[1m2021-01-01 12:00:00 PM\x1b[0m - \x1b[93mWaiting 5 minutes for url\x1b[0m\n".encode()
+        )
+
+    @freeze_time("2021-01-01 12:00:00")
+    @patch("sys.stdout")
+    def test_log_failure(self, mock_stdout):
+        ff_logging.log_failure("Failed to update %s", "url")
+        mock_stdout.buffer.write.assert_called_once_with(
+            "\x1b[1m2021-01-01 12:00:00 PM\x1b[0m - \x1b[91mFailed to update url\x1b[0m\n".encode()
+        )
+
+    @patch("sys.stdout")
+    def test_log_timestamp_follows_clock(self, mock_stdout):
+        with freeze_time("2021-01-01 12:00:00") as frozen:
+            ff_logging.log("first")
+            frozen.tick(0.5)
+            ff_logging.log("second")
+            frozen.tick(1)
+            ff_logging.log("third")
+
+        written = [c.args[0] for c in mock_stdout.buffer.write.call_args_list]
+        self.assertIn(b"2021-01-01 12:00:00 PM", written[0])
+        self.assertIn(b"2021-01-01 12:00:00 PM", written[1])
+        self.assertIn(b"2021-01-01 12:00:01 PM", written[2])
+
+    class CheckLogDebugTestCase(NamedTuple):
+        verbose: bool
+        expected_calls: int
+
+    @parameterized.expand(
+        [
+            CheckLogDebugTestCase(verbose=False, expected_calls=0),
+            CheckLogDebugTestCase(verbose=True, expected_calls=1),
+        ]
+    )
+    @patch("sys.stdout")
+    def test_log_debug(self, verbose, expected_calls, mock_stdout):
+        ff_logging.set_verbose(verbose)
+        self.addCleanup(ff_logging.set_verbose, False)
+        formatted = []
+
+        class Argument:
+            def __str__(self):
+                formatted.append(self)
+                return "argument"
+
+        ff_logging.log_debug("Debugging %s", Argument())
+
+        self.assertEqual(mock_stdout.buffer.write.call_count, expected_calls)
+        # The argument is only formatted when the message is emitted
+        self.assertEqual(bool(formatted), verbose)
+
+    @freeze_time("2021-01-01 12:00:00")
+    @patch("sys.stdout")
+    def test_buffered_log_prints_batch(self, mock_stdout):
+        ff_logging.set_buffered(True)
+        self.addCleanup(ff_logging.set_buffered, False)
+
+        ff_logging.log("first", "OKGREEN")
+        ff_logging.log_failure("second")
+        ff_logging.flush()
+
+        mock_stdout.buffer.write.assert_called_once_with(
+            b"\x1b[1m2021-01-01 12:00:00 PM\x1b[0m - \x1b[92mfirst\x1b[0m\n"
+            b"\x1b[1m2021-01-01 12:00:00 PM\x1b[0m - \x1b[91msecond\x1b[0m\n"
+        )
+        mock_stdout.buffer.flush.assert_called_once()
+
+    @patch("sys.stdout")
+    def test_set_buffered_false_prints_pending_lines(self, mock_stdout):
+        mock_stdout.line_buffering = False
+        ff_logging.set_buffered(True)
+        ff_logging.log("pending")
+        ff_logging.set_buffered(False)
+
+        mock_stdout.buffer.write.assert_called_once()
+        ff_logging.log("direct")
+        self.assertEqual(mock_stdout.buffer.write.call_count, 2)
+        mock_stdout.buffer.flush.assert_called_once()
+
+    @patch("sys.stderr", new_callable=io.StringIO)
+    @patch("sys.stdout")
+    def test_buffered_write_error_keeps_writer_running(
+        self, mock_stdout, mock_stderr
+    ):
+        mock_stdout.buffer.write.side_effect = [BrokenPipeError, None]
+        ff_logging.set_buffered(True)
+        self.addCleanup(ff_logging.set_buffered, False)
+
+        ff_logging.log("lost")
+        ff_logging.flush()
+        ff_logging.log("printed")
+        ff_logging.flush()
+
+        self.assertEqual(mock_stdout.buffer.write.call_count, 2)
+        self.assertIn(b"printed", mock_stdout.buffer.write.call_args.args[0])
+        self.assertIn("BrokenPipeError", mock_stderr.getvalue())
+
+    @patch("sys.stdout")
+    def test_log_prints_directly_once_writer_stops(self, mock_stdout):
+        ff_logging.set_buffered(True)
+        self.addCleanup(ff_logging.set_buffered, False)
+        # Stop the writer without going back to direct mode
+        ff_logging._handler._pending.put(ff_logging._STOP)
+        ff_logging._handler._writer.join()
+
+        ff_logging.log("direct")
+        # Returns at once instead of waiting on the stopped writer
+        ff_logging.flush()
+
+        mock_stdout.buffer.write.assert_called_once()
+        self.assertIn(b"direct", mock_stdout.buffer.write.call_args.args[0])
+
+    class CheckBufferSizeTestCase(NamedTuple):
+        value: Optional[str]
+        expected_size: int
+        expected_writes: int
+
+    @parameterized.expand(
+        [
+            CheckBufferSizeTestCase(
+                value=None, expected_size=1000, expected_writes=0
+            ),
+            CheckBufferSizeTestCase(
+                value="0", expected_size=0, expected_writes=0
+            ),
+            CheckBufferSizeTestCase(
+                value="50", expected_size=50, expected_writes=0
+            ),
+            CheckBufferSizeTestCase(
+                value="lots", expected_size=1000, expected_writes=1
+            ),
+        ]
+    )
+    @patch("sys.stdout")
+    def test_read_buffer_size(
+        self, value, expected_size, expected_writes, mock_stdout
+    ):
+        environ = {}
+        if value is not None:
+            environ["CONSOLE_LOGGING_BUFFER_SIZE"] = value
+        with patch.dict("os.environ", environ, clear=True):
+            self.assertEqual(ff_logging._read_buffer_size(), expected_size)
+        self.assertEqual(mock_stdout.buffer.write.call_count, expected_writes)
+
+    class CheckLineBufferingTestCase(NamedTuple):
+        line_buffering: bool
+        expected_flushes: int
+
+    @parameterized.expand(
+        [
+            CheckLineBufferingTestCase(
+                line_buffering=True, expected_flushes=1
+            ),
+            CheckLineBufferingTestCase(
+                line_buffering=False, expected_flushes=0
+            ),
+        ]
+    )
+    @patch("sys.stdout")
+    def test_log_flushes_line_buffered_stream(
+        self, line_buffering, expected_flushes, mock_stdout
+    ):
+        mock_stdout.line_buffering = line_buffering
+        ff_logging.log("direct")
+        mock_stdout.buffer.write.assert_called_once()
+        self.assertEqual(mock_stdout.buffer.flush.call_count, expected_flushes)
+
+    @patch("sys.stdout", new_callable=io.StringIO)
+    def test_log_without_binary_buffer(self, mock_stdout):
+        ff_logging.log("plain")
+        self.assertTrue(mock_stdout.getvalue().endswith("plain\x1b[0m\n"))
+
 
 if __name__ == "__main__":
     unittest.main()
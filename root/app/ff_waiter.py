@@ -1,65 +1,147 @@
+import heapq
+import itertools
 import multiprocessing as mp
-import threading
-from time import sleep
+import os
+import queue
+import random
+import time
+from typing import Optional
 
 import fanfic_info
 import ff_logging
 
-
-def insert_after_time(queue: mp.Queue, fanfic: fanfic_info.FanficInfo) -> None:
-    """
-    Inserts a fanfic into the queue after a delay.
-
-    Args:
-        queue (mp.Queue): The queue to insert the fanfic into.
-        fanfic (fanfic_info.FanficInfo): The fanfic to insert.
-    """
-    # Insert the fanfic into the queue
-    queue.put(fanfic)
+# Shortest and longest retry delays, in seconds
+kBaseDelay = 60
+kMaxDelay = 1200
+# Random source for retry jitter, owned by this module instead of sharing the
+# random module's global instance. Reseeded in forked children, like the
+# global one, so each process draws its own delays.
+_rng = random.Random()
+os.register_at_fork(after_in_child=_rng.seed)
+# Tie-breaker for retries due at the same moment, so FanficInfo objects are
+# never compared by the heap
+_sequence = itertools.count()
 
 
 def process_fanfic(
-    fanfic: fanfic_info.FanficInfo, processor_queues: dict[str, mp.Queue]
+    fanfic: fanfic_info.FanficInfo,
+    processor_queues: dict[str, mp.Queue],
+    pending: list[tuple[float, int, fanfic_info.FanficInfo, mp.Queue]],
 ) -> None:
     """
-    Processes a single fanfic. It calculates a delay based on the number of repeats for the fanfic,
-    logs a warning message, and starts a timer to insert the fanfic into the appropriate processor queue after the delay.
+    Processes a single fanfic. It calculates a delay for the fanfic, logs a warning message,
+    and schedules the fanfic to be released to its processor queue after the delay.
+
+    The delay uses decorrelated jitter: it is drawn uniformly between kBaseDelay and three
+    times the fanfic's previous delay, capped at kMaxDelay. Delays grow roughly exponentially
+    for a fanfic that keeps failing, while fanfics that failed together spread out.
 
     Args:
         fanfic (fanfic_info.FanficInfo): The fanfic to process.
         processor_queues (dict[str, mp.Queue]): A dictionary of processor queues.
+        pending (list[tuple[float, int, fanfic_info.FanficInfo, mp.Queue]]):
+            The heap of scheduled retries, ordered by the monotonic time they
+            are due, each with the processor queue it is released to.
     """
-    # Calculate the delay based on the number of repeats for the fanfic
-    delay = 60 * fanfic.repeats
+    # Look up the processor queue now, so an unknown site is reported right
+    # away instead of when the delay runs out
+    try:
+        site_queue = processor_queues[fanfic.site]
+    except KeyError:
+        ff_logging.log_failure(
+            "No processor queue for site %s, dropping %s", fanfic.site, fanfic.url
+        )
+        return
+
+    # Calculate the delay based on the previous delay for the fanfic
+    delay = min(
+        kMaxDelay,
+        _rng.uniform(kBaseDelay, max(kBaseDelay, fanfic.last_delay * 3)),
+    )
+    fanfic.last_delay = delay
     # Log a warning message indicating that we're waiting for a certain delay
     ff_logging.log(
-        f"Waiting {fanfic.repeats} minutes for {fanfic.url} in queue {fanfic.site}",
+        "Waiting %.1f minutes for %s in queue %s",
         "WARNING",
+        delay / 60,
+        fanfic.url,
+        fanfic.site,
     )
-    # Start a timer to insert the fanfic into the appropriate processor queue after the delay
-    timer = threading.Timer(
-        delay, insert_after_time, args=(processor_queues[fanfic.site], fanfic)
+    # Schedule the fanfic to be inserted into its processor queue after the delay
+    heapq.heappush(
+        pending,
+        (
+            time.monotonic() + delay,
+            next(_sequence),
+            fanfic,
+            site_queue,
+        ),
     )
-    timer.start()
+
+
+def release_due(
+    pending: list[tuple[float, int, fanfic_info.FanficInfo, mp.Queue]],
+) -> Optional[float]:
+    """
+    Inserts every fanfic whose delay has passed into its processor queue.
+
+    Args:
+        pending (list[tuple[float, int, fanfic_info.FanficInfo, mp.Queue]]):
+            The heap of scheduled retries.
+
+    Returns:
+        Optional[float]: The number of seconds until the next retry is due, or
+            None if no retries are scheduled.
+    """
+    now = time.monotonic()
+    while pending and pending[0][0] <= now:
+        _, _, fanfic, site_queue = heapq.heappop(pending)
+        site_queue.put(fanfic)
+    return pending[0][0] - now if pending else None
 
 
 def wait_processor(processor_queues: dict[str, mp.Queue], waiting_queue: mp.Queue):
     """
     Processes the waiting queue.
 
+    Failed fanfics are held in a single heap ordered by when they are due,
+    instead of one timer thread per fanfic. Between releases the processor
+    blocks on the waiting queue until either a new fanfic arrives or the next
+    retry is due.
+
     Args:
         processor_queues (dict[str, mp.Queue]): A dictionary of processor queues.
         waiting_queue (mp.Queue): The waiting queue.
     """
-    while True:
-        # Get a fanfic from the waiting queue
-        fanfic: fanfic_info.FanficInfo = waiting_queue.get()
+    # Retries wait for minutes anyway, so give the CPU to the download workers
+    try:
+        os.nice(10)
+    except (AttributeError, OSError):
+        pass
+
+    # Print the retry warnings from a background thread, so logging never
+    # holds up releasing due fanfics
+    ff_logging.set_buffered(True)
+    try:
+        pending: list[tuple[float, int, fanfic_info.FanficInfo, mp.Queue]] = []
+        while True:
+            # Release any fanfics whose delay has passed
+            timeout = release_due(pending)
 
-        # If the fanfic is None, this signals that we should stop processing the waiting queue
-        if fanfic is None:
-            break
+            # Get a fanfic from the waiting queue, waking up when the next one is due
+            try:
+                fanfic: fanfic_info.FanficInfo = waiting_queue.get(
+                    timeout=timeout
+                )
+            except queue.Empty:
+                continue
 
-        # Process the fanfic
-        process_fanfic(fanfic, processor_queues)
+            # If the fanfic is None, this signals that we should stop processing the waiting queue
+            if fanfic is None:
+                break
 
-        sleep(5)  # Sleep for 5 seconds to avoid busy-waiting
+            # Process the fanfic
+            process_fanfic(fanfic, processor_queues, pending)
+    finally:
+        # Print anything still queued before the process exits
+        ff_logging.set_buffered(False)
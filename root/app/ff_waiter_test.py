@@ -1,7 +1,8 @@
-import multiprocessing as mp
+import queue
+import time
 from typing import NamedTuple
 import unittest
-from unittest.mock import patch, Mock
+from unittest.mock import patch
 
 from freezegun import freeze_time
 from parameterized import parameterized
@@ -12,34 +13,111 @@ import ff_waiter
 
 class TestWaitFunction(unittest.TestCase):
     class CheckTimerProcessingTestCase(NamedTuple):
-        repeats: int
-        expected_time: int
+        last_delay: float
+        upper_bound: float
+        expected_time: float
 
     @parameterized.expand(
         [
-            CheckTimerProcessingTestCase(repeats=0, expected_time=0),
-            CheckTimerProcessingTestCase(repeats=1, expected_time=60),
-            CheckTimerProcessingTestCase(repeats=2, expected_time=120),
-            CheckTimerProcessingTestCase(repeats=3, expected_time=180),
-            CheckTimerProcessingTestCase(repeats=4, expected_time=240),
-            CheckTimerProcessingTestCase(repeats=5, expected_time=300),
+            CheckTimerProcessingTestCase(
+                last_delay=0, upper_bound=60, expected_time=60
+            ),
+            CheckTimerProcessingTestCase(
+                last_delay=50, upper_bound=150, expected_time=150
+            ),
+            CheckTimerProcessingTestCase(
+                last_delay=100, upper_bound=300, expected_time=300
+            ),
+            CheckTimerProcessingTestCase(
+                last_delay=1000, upper_bound=3000, expected_time=1200
+            ),
         ]
     )
     @freeze_time("2021-01-01 12:00:00")
-    @patch("builtins.print")
-    @patch("threading.Timer")
-    def test_wait(self, repeats, expected_time, mock_timer, mock_print):
-        fanfic = fanfic_info.FanficInfo(site="site", url="url", repeats=repeats)
-        queue = mp.Queue()
-        processor_queues = {"site": queue}
-        ff_waiter.process_fanfic(fanfic, processor_queues)
-        mock_print.assert_called_once_with(
-            f"\x1b[1m2021-01-01 12:00:00 PM\x1b[0m - \x1b[93mWaiting {repeats} minutes for url in queue site\x1b[0m"
+    @patch("sys.stdout")
+    @patch("ff_waiter._rng.uniform", side_effect=lambda low, high: high)
+    def test_wait(
+        self, last_delay, upper_bound, expected_time, mock_uniform, mock_stdout
+    ):
+        fanfic = fanfic_info.FanficInfo(site="site", url="url")
+        fanfic.last_delay = last_delay
+        site_queue = queue.Queue()
+        pending = []
+        ff_waiter.process_fanfic(fanfic, {"site": site_queue}, pending)
+        message = f"Waiting {expected_time / 60:.1f} minutes for url in queue site"
+        mock_stdout.buffer.write.assert_called_once_with(
+            f"\x1b[1m2021-01-01 12:00:00 PM\x1b[0m - \x1b[93m{message}\x1b[0m\n".encode()
         )
-        mock_timer.assert_called_once_with(
-            expected_time, ff_waiter.insert_after_time, args=(queue, fanfic)
+        mock_uniform.assert_called_once_with(60, upper_bound)
+        self.assertEqual(fanfic.last_delay, expected_time)
+        self.assertEqual(len(pending), 1)
+        due, _, scheduled, scheduled_queue = pending[0]
+        self.assertEqual(due, time.monotonic() + expected_time)
+        self.assertIs(scheduled, fanfic)
+        self.assertIs(scheduled_queue, site_queue)
+
+    @freeze_time("2021-01-01 12:00:00")
+    @patch("sys.stdout")
+    def test_wait_unknown_site(self, mock_stdout):
+        fanfic = fanfic_info.FanficInfo(site="unknown", url="url")
+        pending = []
+        ff_waiter.process_fanfic(fanfic, {"site": queue.Queue()}, pending)
+        mock_stdout.buffer.write.assert_called_once_with(
+            b"\x1b[1m2021-01-01 12:00:00 PM\x1b[0m - \x1b[91mNo processor queue for site unknown, dropping url\x1b[0m\n"
+        )
+        self.assertEqual(pending, [])
+        self.assertEqual(fanfic.last_delay, 0)
+
+    @freeze_time("2021-01-01 12:00:00")
+    @patch("sys.stdout")
+    @patch("ff_waiter._rng.uniform", side_effect=lambda low, high: high)
+    def test_release_due(self, mock_uniform, mock_stdout):
+        first = fanfic_info.FanficInfo(site="site", url="first")
+        second = fanfic_info.FanficInfo(site="other", url="second")
+        second.last_delay = 40
+        processor_queues = {"site": queue.Queue(), "other": queue.Queue()}
+        pending = []
+        ff_waiter.process_fanfic(second, processor_queues, pending)
+        ff_waiter.process_fanfic(first, processor_queues, pending)
+
+        # Nothing is due yet; the first retry is a minute away
+        self.assertEqual(ff_waiter.release_due(pending), 60)
+        self.assertTrue(processor_queues["site"].empty())
+
+        with freeze_time("2021-01-01 12:01:00"):
+            self.assertEqual(ff_waiter.release_due(pending), 60)
+        self.assertIs(processor_queues["site"].get_nowait(), first)
+        self.assertTrue(processor_queues["other"].empty())
+
+        with freeze_time("2021-01-01 12:02:00"):
+            self.assertIsNone(ff_waiter.release_due(pending))
+        self.assertIs(processor_queues["other"].get_nowait(), second)
+
+    @patch("ff_waiter.os.nice")
+    @patch("sys.stdout")
+    @patch("ff_waiter._rng.uniform", side_effect=[0, 300])
+    def test_wait_processor_stops_on_none(
+        self, mock_uniform, mock_stdout, mock_nice
+    ):
+        ready = fanfic_info.FanficInfo(site="site", url="ready")
+        later = fanfic_info.FanficInfo(site="site", url="later")
+        processor_queues = {"site": queue.Queue()}
+        waiting_queue = queue.Queue()
+        waiting_queue.put(ready)
+        waiting_queue.put(later)
+        waiting_queue.put(None)
+
+        ff_waiter.wait_processor(processor_queues, waiting_queue)
+
+        # Only the retry without a delay is released before stopping
+        self.assertIs(processor_queues["site"].get_nowait(), ready)
+        self.assertTrue(processor_queues["site"].empty())
+        mock_nice.assert_called_once_with(10)
+        # Both warnings are printed before wait_processor returns
+        written = b"".join(
+            c.args[0] for c in mock_stdout.buffer.write.call_args_list
         )
-        mock_timer.return_value.start.assert_called_once()
+        self.assertEqual(written.count(b"Waiting"), 2)
 
 
 if __name__ == "__main__":
@@ -12,15 +12,20 @@ The derived classes must mark themselves as `enabled` if they are able to send n
 by setting `self.enabled` to True.
 
 The derived classes are responsible for extracting their configuration information from the
-TOML file that has been loaded into `self.config`.
+TOML file that has been loaded into `self.config`. The parsed file is shared with everything
+else loaded from the same path through `system_utils.load_toml`, so `self.config` must not be
+modified.
 """
 
 import time
-import tomllib
 from typing import Callable, Any
 
+import system_utils
+
 kSleepTime = 10
 kMaxAttempts = 3
+# Delays before each retry, computed once from the constants above
+_backoff = tuple(kSleepTime * attempt for attempt in range(1, kMaxAttempts))
 
 
 class NotificationBase:
@@ -31,8 +36,7 @@ class NotificationBase:
         self.enabled = False
 
         # Load the configuration from the TOML file
-        with open(toml_path, "rb") as file:
-            self.config = tomllib.load(file)
+        self.config = system_utils.load_toml(toml_path)
 
     def send_notification(self, title: str, body: str, site: str) -> bool:
         """
@@ -50,20 +54,24 @@ class NotificationBase:
 
 def retry_decorator(func: Callable) -> Callable:
     """
-    A decorator that retries a function up to 3 times with a 30-second delay between attempts.
+    A decorator that retries a function up to 3 times, sleeping 10 and then 20 seconds between
+    attempts.
 
     Args:
-        func (Callable): The function to be retried.
+        func (Callable): The function to be retried. It should return True on success.
 
     Returns:
-        Callable: The wrapped function with retry logic.
+        Callable: The wrapped function with retry logic. It returns True if any attempt
+            succeeded, and False otherwise.
     """
 
-    def wrapper(*args: Any, **kwargs: Any) -> None:
-        for attempt in range(kMaxAttempts):
+    def wrapper(*args: Any, **kwargs: Any) -> bool:
+        if func(*args, **kwargs):
+            return True
+        for delay in _backoff:
+            time.sleep(delay)
             if func(*args, **kwargs):
-                return
-            elif attempt < kMaxAttempts - 1:
-                time.sleep(kSleepTime * (attempt + 1))
+                return True
+        return False
 
     return wrapper
@@ -6,7 +6,6 @@ from notification_base import (
     kSleepTime,
     kMaxAttempts,
 )
-import tomllib
 
 
 class TestNotificationBase(unittest.TestCase):
@@ -41,7 +40,7 @@ class TestRetryDecorator(unittest.TestCase):
         # Test that the decorated function is called once if it succeeds
         mock_func = MagicMock(return_value=True)
         decorated_func = retry_decorator(mock_func)
-        decorated_func()
+        self.assertTrue(decorated_func())
         mock_func.assert_called_once()
         mock_sleep.assert_not_called()
 
@@ -50,12 +49,21 @@ class TestRetryDecorator(unittest.TestCase):
         # Test that the decorated function is retried up to 3 times if it fails
         mock_func = MagicMock(return_value=False)
         decorated_func = retry_decorator(mock_func)
-        decorated_func()
+        self.assertFalse(decorated_func())
         self.assertEqual(mock_func.call_count, kMaxAttempts)
         self.assertEqual(mock_sleep.call_count, kMaxAttempts - 1)
         for i in range(kMaxAttempts - 1):
             mock_sleep.assert_any_call(kSleepTime * (i + 1))
 
+    @patch("time.sleep", return_value=None)
+    def test_retry_decorator_succeeds_on_retry(self, mock_sleep):
+        # Test that a later success stops the retries and is reported
+        mock_func = MagicMock(side_effect=[False, True])
+        decorated_func = retry_decorator(mock_func)
+        self.assertTrue(decorated_func())
+        self.assertEqual(mock_func.call_count, 2)
+        mock_sleep.assert_called_once_with(kSleepTime)
+
 
 if __name__ == "__main__":
     unittest.main()
@@ -1,5 +1,5 @@
 import notification_base
-from typing import List
+from typing import List, Optional
 from concurrent.futures import ThreadPoolExecutor
 
 
@@ -9,6 +9,19 @@ class NotificationWrapper:
         Initializes the NotificationWrapper with an empty list of notification workers.
         """
         self.notification_workers: List[notification_base.NotificationBase] = []
+        # The enabled subset of notification_workers, kept up to date as workers are added
+        self._enabled_workers: List[notification_base.NotificationBase] = []
+        # Created on first use and reused for every notification after that
+        self._executor: Optional[ThreadPoolExecutor] = None
+
+    def __getstate__(self) -> dict:
+        """
+        Returns the state to pickle. The wrapper is pickled into each pool
+        worker, and the thread pool can't be, so every process creates its own.
+        """
+        state = self.__dict__.copy()
+        state["_executor"] = None
+        return state
 
     def add_notification_worker(
         self, notification_worker: notification_base.NotificationBase
@@ -20,6 +33,8 @@ class NotificationWrapper:
             notification_worker (notification_base.NotificationBase): The notification worker to add.
         """
         self.notification_workers.append(notification_worker)
+        if notification_worker.enabled:
+            self._enabled_workers.append(notification_worker)
 
     def send_notification(self, title: str, body: str, site: str) -> None:
         """
@@ -30,16 +45,33 @@ class NotificationWrapper:
             body (str): The body of the notification.
             site (str): The site to which the notification is sent.
         """
-        enabled_workers = [
-            worker for worker in self.notification_workers if worker.enabled
-        ]
+        enabled_workers = self._enabled_workers
+        if not enabled_workers:
+            return
+        if len(enabled_workers) == 1:
+            # A single worker is called directly; the thread pool would only add overhead
+            enabled_workers[0].send_notification(title, body, site)
+            return
 
-        with ThreadPoolExecutor() as executor:
-            futures = [
-                executor.submit(worker.send_notification, title, body, site)
-                for worker in enabled_workers
-            ]
+        if self._executor is None:
+            # One thread per enabled worker is enough to send to all of them at once
+            self._executor = ThreadPoolExecutor(
+                max_workers=len(enabled_workers),
+                thread_name_prefix="notification",
+            )
+        futures = [
+            self._executor.submit(worker.send_notification, title, body, site)
+            for worker in enabled_workers
+        ]
 
-        # Optionally, you can wait for all futures to complete if needed
+        # Wait for all workers to finish
         for future in futures:
             future.result()  # This will raise an exception if the worker raised one
+
+    def close(self) -> None:
+        """
+        Shuts down the thread pool, waiting for any notifications in flight.
+        """
+        if self._executor is not None:
+            self._executor.shutdown(wait=True)
+            self._executor = None
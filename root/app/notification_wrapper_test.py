@@ -1,3 +1,4 @@
+import pickle
 from typing import NamedTuple, Optional, Type
 import unittest
 from unittest.mock import call, MagicMock, patch
@@ -8,6 +9,15 @@ import notification_base
 from notification_wrapper import NotificationWrapper
 
 
+class StubWorker(notification_base.NotificationBase):
+    # An enabled worker that can be pickled, unlike a MagicMock
+    def __init__(self):
+        self.enabled = True
+
+    def send_notification(self, title, body, site):
+        return True
+
+
 class TestNotificationWrapper(unittest.TestCase):
     class AddNotificationWorkerTestCase(NamedTuple):
         worker_enabled: bool
@@ -45,6 +55,7 @@ class TestNotificationWrapper(unittest.TestCase):
         title: str
         body: str
         site: str
+        expected_submits: int
         expected_calls: int
 
     @parameterized.expand(
@@ -55,14 +66,16 @@ class TestNotificationWrapper(unittest.TestCase):
                 title="title1",
                 body="body1",
                 site="site1",
+                expected_submits=0,
                 expected_calls=0,
             ),
-            # Test case: One enabled worker
+            # Test case: One enabled worker, called without the thread pool
             SendNotificationTestCase(
                 workers=[True],
                 title="title2",
                 body="body2",
                 site="site2",
+                expected_submits=0,
                 expected_calls=1,
             ),
             # Test case: One disabled worker
@@ -71,6 +84,7 @@ class TestNotificationWrapper(unittest.TestCase):
                 title="title3",
                 body="body3",
                 site="site3",
+                expected_submits=0,
                 expected_calls=0,
             ),
             # Test case: Multiple workers, mixed enabled and disabled
@@ -79,7 +93,8 @@ class TestNotificationWrapper(unittest.TestCase):
                 title="title4",
                 body="body4",
                 site="site4",
-                expected_calls=2,
+                expected_submits=2,
+                expected_calls=0,
             ),
         ]
     )
@@ -90,6 +105,7 @@ class TestNotificationWrapper(unittest.TestCase):
         title,
         body,
         site,
+        expected_submits,
         expected_calls,
         mock_executor,
     ):
@@ -113,10 +129,20 @@ class TestNotificationWrapper(unittest.TestCase):
 
         # Assertion: Check that the correct number of calls were made
         self.assertEqual(
-            mock_executor_instance.submit.call_count, expected_calls
+            mock_executor_instance.submit.call_count, expected_submits
         )
+        # Workers called directly on the current thread
+        direct_calls = sum(
+            mock_worker.send_notification.call_count
+            for mock_worker in mock_workers
+        )
+        self.assertEqual(direct_calls, expected_calls)
         for mock_worker in mock_workers:
-            if mock_worker.enabled:
+            if expected_calls and mock_worker.enabled:
+                mock_worker.send_notification.assert_called_once_with(
+                    title, body, site
+                )
+            elif mock_worker.enabled:
                 mock_executor_instance.submit.assert_any_call(
                     mock_worker.send_notification, title, body, site
                 )
@@ -126,6 +152,60 @@ class TestNotificationWrapper(unittest.TestCase):
                     not in mock_executor_instance.submit
                 )
 
+    @patch("notification_wrapper.ThreadPoolExecutor")
+    def test_send_notification_without_enabled_workers(self, mock_executor):
+        wrapper = NotificationWrapper()
+        mock_worker = MagicMock(spec=notification_base.NotificationBase)
+        mock_worker.enabled = False
+        wrapper.add_notification_worker(mock_worker)
+
+        wrapper.send_notification("title", "body", "site")
+
+        mock_executor.assert_not_called()
+        mock_worker.send_notification.assert_not_called()
+
+    @patch("notification_wrapper.ThreadPoolExecutor")
+    def test_send_notification_reuses_executor(self, mock_executor):
+        wrapper = NotificationWrapper()
+        for _ in range(2):
+            mock_worker = MagicMock(spec=notification_base.NotificationBase)
+            mock_worker.enabled = True
+            wrapper.add_notification_worker(mock_worker)
+
+        wrapper.send_notification("title1", "body1", "site1")
+        wrapper.send_notification("title2", "body2", "site2")
+
+        mock_executor.assert_called_once_with(
+            max_workers=2, thread_name_prefix="notification"
+        )
+        self.assertEqual(mock_executor.return_value.submit.call_count, 4)
+
+        wrapper.close()
+        mock_executor.return_value.shutdown.assert_called_once_with(wait=True)
+
+    @patch("notification_wrapper.ThreadPoolExecutor")
+    def test_send_notification_single_worker_raises(self, mock_executor):
+        wrapper = NotificationWrapper()
+        mock_worker = MagicMock(spec=notification_base.NotificationBase)
+        mock_worker.enabled = True
+        mock_worker.send_notification.side_effect = RuntimeError("failed")
+        wrapper.add_notification_worker(mock_worker)
+
+        with self.assertRaises(RuntimeError):
+            wrapper.send_notification("title", "body", "site")
+        mock_executor.assert_not_called()
+
+    def test_pickle_drops_executor(self):
+        wrapper = NotificationWrapper()
+        wrapper.add_notification_worker(StubWorker())
+        wrapper.add_notification_worker(StubWorker())
+        wrapper.send_notification("title", "body", "site")
+        self.addCleanup(wrapper.close)
+
+        restored = pickle.loads(pickle.dumps(wrapper))
+        self.assertIsNone(restored._executor)
+        self.assertEqual(len(restored.notification_workers), 2)
+
 
 if __name__ == "__main__":
     unittest.main()
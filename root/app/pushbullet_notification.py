@@ -41,8 +41,11 @@ class PushbulletNotification(notification_base.NotificationBase):
         # If Pushbullet is enabled, send the notification
         try:
             ff_logging.log(
-                f"\t({site}) Sending Pushbullet notification: {title} - {body}",
+                "\t(%s) Sending Pushbullet notification: %s - %s",
                 "OKGREEN",
+                site,
+                title,
+                body,
             )
             self.pb.push_note(title, body)
             return True
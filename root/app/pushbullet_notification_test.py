@@ -64,7 +64,7 @@ class TestPushbulletNotification(unittest.TestCase):
     @patch("pushbullet_notification.Pushbullet")
     @patch("pushbullet_notification.ff_logging.log_failure")
     @patch("pushbullet_notification.ff_logging.log")
-    @patch("pushbullet_notification.notification_base.tomllib.load")
+    @patch("pushbullet_notification.notification_base.system_utils.tomllib.load")
     @patch("builtins.open", new_callable=MagicMock)
     def test_init(
         self,
@@ -147,7 +147,7 @@ class TestPushbulletNotification(unittest.TestCase):
     @patch("pushbullet_notification.Pushbullet")
     @patch("pushbullet_notification.ff_logging.log_failure")
     @patch("pushbullet_notification.ff_logging.log")
-    @patch("pushbullet_notification.notification_base.tomllib.load")
+    @patch("pushbullet_notification.notification_base.system_utils.tomllib.load")
     @patch("builtins.open", new_callable=MagicMock)
     def test_send_notification(
         self,
@@ -178,15 +178,18 @@ class TestPushbulletNotification(unittest.TestCase):
         mock_pushbullet.push_note.return_value = None
         mock_pushbullet.push_note.side_effect = side_effect
 
-        pushbullet_notification.notification_base.kSleepTime = 0
         max_attempts = pushbullet_notification.notification_base.kMaxAttempts
-        # Execution: Call send_notification
-        pb_notification.send_notification(title, body, site)
+        # Execution: Call send_notification, skipping the retry delays
+        with patch("notification_base.time.sleep"):
+            pb_notification.send_notification(title, body, site)
         # Assertion: Check that the logging functions were called as expected
         if log_called:
             expected_call = call(
-                f"\t({site}) Sending Pushbullet notification: {title} - {body}",
+                "\t(%s) Sending Pushbullet notification: %s - %s",
                 "OKGREEN",
+                site,
+                title,
+                body,
             )
 
             # Check that the call was made three times
@@ -41,6 +41,41 @@ bad_request = re.compile(r".*400 Client Error: Bad Request for url:.*")
 forbidden_client = re.compile(r".*403 Client Error: Forbidden for url:.*")
 flaresolverr = re.compile(r".*Connection to flaresolverr proxy server failed.*")
 
+# Output patterns that mean the update failed, and the message to log for each
+failure_regexes = (
+    (
+        equal_chapters,
+        "Issue with story, site is broken. Story likely hasn't updated on site yet.",
+    ),
+    (
+        bad_chapters,
+        "Something is messed up with the site or the epub. No chapters found.",
+    ),
+    (no_url, "No URL in epub to update from. Fix the metadata."),
+    (failed_login, "Login failed. Check your username and password."),
+    (bad_request, "Bad request. Check the URL."),
+    (
+        forbidden_client,
+        "Forbidden client. Check the URL. If this is ff.net, check that you have Flaresolverr installed, or cry.",
+    ),
+    (
+        flaresolverr,
+        "Flaresolverr connection failed. Check your Flaresolverr installation.",
+    ),
+)
+
+# Output patterns that mean the update can be retried with --force
+forceable_regexes = (
+    (
+        chapter_difference,
+        "Chapter difference between source and destination. Forcing update.",
+    ),
+    (
+        more_chapters,
+        "File has been updated more recently than the story, this is likely a metadata bug. Forcing update.",
+    ),
+)
+
 
 def extract_filename(filename: str) -> str:
     """
@@ -88,27 +123,6 @@ def check_failure_regexes(output: str) -> bool:
         bool: True if none of the failure regexes match, indicating no failure
         detected.
     """
-    failure_regexes = [
-        (
-            equal_chapters,
-            "Issue with story, site is broken. Story likely hasn't updated on site yet.",
-        ),
-        (
-            bad_chapters,
-            "Something is messed up with the site or the epub. No chapters found.",
-        ),
-        (no_url, "No URL in epub to update from. Fix the metadata."),
-        (failed_login, "Login failed. Check your username and password."),
-        (bad_request, "Bad request. Check the URL."),
-        (
-            forbidden_client,
-            "Forbidden client. Check the URL. If this is ff.net, check that you have Flaresolverr installed, or cry.",
-        ),
-        (
-            flaresolverr,
-            "Flaresolverr connection failed. Check your Flaresolverr installation.",
-        ),
-    ]
     return not any(
         check_regexes(output, regex, message)
         for regex, message in failure_regexes
@@ -127,16 +141,6 @@ def check_forceable_regexes(output: str) -> bool:
         bool: True if any of the forceable regexes match, indicating a condition
         that can be forced.
     """
-    forceable_regexes = [
-        (
-            chapter_difference,
-            "Chapter difference between source and destination. Forcing update.",
-        ),
-        (
-            more_chapters,
-            "File has been updated more recently than the story, this is likely a metadata bug. Forcing update.",
-        ),
-    ]
     return any(
         check_regexes(output, regex, message)
         for regex, message in forceable_regexes
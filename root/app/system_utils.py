@@ -1,10 +1,23 @@
+# calibre_info loads its config through this module, so annotations are not
+# evaluated at import to let the two modules import each other
+from __future__ import annotations
+
 from contextlib import contextmanager
 import os
 import shutil
 from tempfile import mkdtemp
+import tomllib
 
 import calibre_info
 
+# Contents of the ini files copied into each temporary directory, keyed by
+# path along with the modification time and size they were read at.
+_ini_cache: dict[str, tuple[int, int, bytes]] = {}
+
+# Parsed TOML files, keyed by absolute path along with the modification time
+# and size they were read at.
+_toml_cache: dict[str, tuple[int, int, dict]] = {}
+
 
 @contextmanager
 def temporary_directory():
@@ -72,6 +85,73 @@ def get_files(directory_path, file_extension=None, return_full_path=False):
     return files
 
 
+def read_ini(path: str) -> bytes:
+    """
+    Reads an ini file, serving it from memory if it is unchanged on disk.
+
+    The file is only re-read when its modification time or size differs from
+    the last read, so edits made while running are still picked up.
+
+    Args:
+        path (str): The path to the ini file.
+
+    Returns:
+        bytes: The contents of the ini file.
+    """
+    stat = os.stat(path)
+    cached = _ini_cache.get(path)
+    if cached and cached[:2] == (stat.st_mtime_ns, stat.st_size):
+        return cached[2]
+
+    with open(path, "rb") as file:
+        contents = file.read()
+    _ini_cache[path] = (stat.st_mtime_ns, stat.st_size, contents)
+    return contents
+
+
+def load_toml(toml_path: str) -> dict:
+    """
+    Loads a TOML file, reusing the parsed contents if it is unchanged on disk.
+
+    The email settings, the Calibre settings and every notification worker are
+    read from the same config file, so only the first of them parses it. The
+    returned dict is shared and must not be modified. The file is parsed again
+    when its modification time or size changes. Paths that can't be stat'ed
+    are opened directly, so a missing file raises the same error as before.
+
+    Args:
+        toml_path (str): The path to the TOML file.
+
+    Returns:
+        dict: The parsed TOML file.
+    """
+    # The config path is normally already absolute, which needs no normalizing
+    path = (
+        toml_path if os.path.isabs(toml_path) else os.path.abspath(toml_path)
+    )
+    try:
+        stat = os.stat(path)
+    except OSError:
+        with open(toml_path, "rb") as file:
+            return tomllib.load(file)
+
+    cached = _toml_cache.get(path)
+    if cached and cached[:2] == (stat.st_mtime_ns, stat.st_size):
+        return cached[2]
+
+    with open(toml_path, "rb") as file:
+        config = tomllib.load(file)
+    _toml_cache[path] = (stat.st_mtime_ns, stat.st_size, config)
+    return config
+
+
+def clear_toml_cache() -> None:
+    """
+    Forgets every parsed TOML file, so the next load reads from disk.
+    """
+    _toml_cache.clear()
+
+
 def copy_configs_to_temp_dir(
     cdb: calibre_info.CalibreInfo, temp_dir: str
 ) -> None:
@@ -82,9 +162,10 @@ def copy_configs_to_temp_dir(
         cdb (calibre_info.CalibreInfo): The Calibre information object.
         temp_dir (str): The path to the temporary directory.
     """
-    if cdb.default_ini:
-        shutil.copyfile(cdb.default_ini, os.path.join(temp_dir, "defaults.ini"))
-    if cdb.personal_ini:
-        shutil.copyfile(
-            cdb.personal_ini, os.path.join(temp_dir, "personal.ini")
-        )
+    for ini_path, filename in (
+        (cdb.default_ini, "defaults.ini"),
+        (cdb.personal_ini, "personal.ini"),
+    ):
+        if ini_path:
+            with open(os.path.join(temp_dir, filename), "wb") as file:
+                file.write(read_ini(ini_path))
@@ -5,10 +5,18 @@ from system_utils import (
     temporary_directory,
     get_files,
     copy_configs_to_temp_dir,
+    read_ini,
+    load_toml,
+    clear_toml_cache,
 )
 import os
+import tomllib
 from typing import NamedTuple, Optional
 
+from calibre_info import CalibreInfo
+from notification_base import NotificationBase
+from url_ingester import EmailInfo
+
 
 class TestSystemUtils(unittest.TestCase):
     @patch("system_utils.mkdtemp", return_value="/fake/temp/dir")
@@ -72,62 +80,124 @@ class TestSystemUtils(unittest.TestCase):
     class CopyConfigsTestCase(NamedTuple):
         default_ini: Optional[str]
         personal_ini: Optional[str]
-        expected_calls: list
+        expected_files: dict
 
     @parameterized.expand(
         [
             CopyConfigsTestCase(
-                default_ini=os.path.join("fake", "path", "defaults.ini"),
-                personal_ini=os.path.join("fake", "path", "personal.ini"),
-                expected_calls=[
-                    (
-                        os.path.join("fake", "path", "defaults.ini"),
-                        os.path.join("fake", "temp", "dir", "defaults.ini"),
-                    ),
-                    (
-                        os.path.join("fake", "path", "personal.ini"),
-                        os.path.join("fake", "temp", "dir", "personal.ini"),
-                    ),
-                ],
+                default_ini="[defaults]",
+                personal_ini="[personal]",
+                expected_files={
+                    "defaults.ini": b"[defaults]",
+                    "personal.ini": b"[personal]",
+                },
             ),
             CopyConfigsTestCase(
                 default_ini=None,
-                personal_ini=os.path.join("fake", "path", "personal.ini"),
-                expected_calls=[
-                    (
-                        os.path.join("fake", "path", "personal.ini"),
-                        os.path.join("fake", "temp", "dir", "personal.ini"),
-                    ),
-                ],
+                personal_ini="[personal]",
+                expected_files={"personal.ini": b"[personal]"},
             ),
             CopyConfigsTestCase(
-                default_ini=os.path.join("fake", "path", "defaults.ini"),
+                default_ini="[defaults]",
                 personal_ini=None,
-                expected_calls=[
-                    (
-                        os.path.join("fake", "path", "defaults.ini"),
-                        os.path.join("fake", "temp", "dir", "defaults.ini"),
-                    ),
-                ],
+                expected_files={"defaults.ini": b"[defaults]"},
             ),
         ]
     )
-    @patch("shutil.copyfile")
     def test_copy_configs_to_temp_dir(
         self,
         default_ini,
         personal_ini,
-        expected_calls,
-        mock_copyfile,
+        expected_files,
     ):
         # Test copying configuration files to a temporary directory
-        cdb = MagicMock()
-        cdb.default_ini = default_ini
-        cdb.personal_ini = personal_ini
-        copy_configs_to_temp_dir(cdb, os.path.join("fake", "temp", "dir"))
-        for call_args in expected_calls:
-            mock_copyfile.assert_any_call(*call_args)
-        self.assertEqual(mock_copyfile.call_count, len(expected_calls))
+        with (
+            temporary_directory() as config_dir,
+            temporary_directory() as temp_dir,
+        ):
+            cdb = MagicMock()
+            cdb.default_ini = None
+            cdb.personal_ini = None
+            if default_ini is not None:
+                cdb.default_ini = os.path.join(config_dir, "defaults.ini")
+                with open(cdb.default_ini, "w") as file:
+                    file.write(default_ini)
+            if personal_ini is not None:
+                cdb.personal_ini = os.path.join(config_dir, "personal.ini")
+                with open(cdb.personal_ini, "w") as file:
+                    file.write(personal_ini)
+
+            copy_configs_to_temp_dir(cdb, temp_dir)
+
+            self.assertEqual(
+                sorted(os.listdir(temp_dir)), sorted(expected_files)
+            )
+            for filename, contents in expected_files.items():
+                with open(os.path.join(temp_dir, filename), "rb") as file:
+                    self.assertEqual(file.read(), contents)
+
+    def test_read_ini_uses_cache_until_file_changes(self):
+        # Test that an unchanged ini file is only read from disk once
+        with temporary_directory() as config_dir:
+            ini_path = os.path.join(config_dir, "personal.ini")
+            with open(ini_path, "w") as file:
+                file.write("[personal]")
+
+            with patch("builtins.open", wraps=open) as mock_open:
+                self.assertEqual(read_ini(ini_path), b"[personal]")
+                self.assertEqual(read_ini(ini_path), b"[personal]")
+            self.assertEqual(mock_open.call_count, 1)
+
+            with open(ini_path, "w") as file:
+                file.write("[personal]\nusername=user")
+            self.assertEqual(read_ini(ini_path), b"[personal]\nusername=user")
+
+
+class TestLoadToml(unittest.TestCase):
+    def setUp(self):
+        self.addCleanup(clear_toml_cache)
+
+    def test_load_toml_uses_cache_until_file_changes(self):
+        with temporary_directory() as temp_dir:
+            toml_path = os.path.join(temp_dir, "config.toml")
+            with open(toml_path, "w") as file:
+                file.write("[pushbullet]\nenabled = false\n")
+
+            with patch("tomllib.load", wraps=tomllib.load) as mock_toml_load:
+                first = load_toml(toml_path)
+                second = load_toml(toml_path)
+                self.assertIs(first, second)
+                self.assertEqual(mock_toml_load.call_count, 1)
+
+                with open(toml_path, "w") as file:
+                    file.write("[pushbullet]\nenabled = true\n")
+                os.utime(toml_path, ns=(0, 0))
+
+                self.assertEqual(
+                    load_toml(toml_path), {"pushbullet": {"enabled": True}}
+                )
+                self.assertEqual(mock_toml_load.call_count, 2)
+
+    def test_config_readers_share_parsed_file(self):
+        with temporary_directory() as temp_dir:
+            toml_path = os.path.join(temp_dir, "config.toml")
+            with open(toml_path, "w") as file:
+                file.write(
+                    '[email]\nemail = "user"\n\n[calibre]\npath = "library"\n'
+                )
+
+            with patch("tomllib.load", wraps=tomllib.load) as mock_toml_load:
+                email_info = EmailInfo(toml_path)
+                calibre_info = CalibreInfo(toml_path, MagicMock())
+                notification = NotificationBase(toml_path)
+            self.assertEqual(mock_toml_load.call_count, 1)
+            self.assertEqual(email_info.email, "user")
+            self.assertEqual(calibre_info.location, "library")
+            self.assertIn("email", notification.config)
+
+    def test_load_toml_missing_file(self):
+        with self.assertRaises(FileNotFoundError):
+            load_toml("does/not/exist.toml")
 
 
 if __name__ == "__main__":
@@ -1,13 +1,13 @@
+import functools
 import multiprocessing as mp
 import socket
 import time
 import logging
-import tomllib
 from contextlib import contextmanager
-from fanficfare import geturls
 import ff_logging
 import regex_parsing
 import notification_wrapper
+import system_utils
 
 
 @contextmanager
@@ -26,35 +26,24 @@ def set_timeout(timeout_duration):
         socket.setdefaulttimeout(old_timeout)
 
 
-@contextmanager
-def suppress_logging():
+@functools.cache
+def load_geturls():
     """
-    A context manager that temporarily suppresses all logging output.
-
-    This context manager disables all logging across the application by setting the
-    logging level to CRITICAL, which is the highest level. Only messages with a
-    level CRITICAL or higher would be processed. Since typically there are no
-    messages at a level higher than CRITICAL, this effectively suppresses all
-    logging while the context manager is active. Once the code block using this
-    context manager exits, the original logging level is restored, allowing logging
-    to proceed as before.
-
-    Usage:
-        with suppress_logging():
-            # Code block where logging is suppressed
-            pass
-
-    Yields:
-        None
+    Imports FanFicFare's geturls module on first use and silences FanFicFare's
+    logging.
+
+    The import is deferred so that processes which never poll the mailbox (the
+    url workers and the waiter) don't pay for FanFicFare's adapter imports.
+    FanFicFare sets its logger to DEBUG when imported, so the level is lowered
+    here once for the whole process instead of around every poll.
+
+    Returns:
+        module: The fanficfare.geturls module.
     """
-    # Save the current global logging level
-    old_level = logging.root.manager.disable
-    # Temporarily set global logging level to CRITICAL to suppress all logging
-    logging.disable(logging.CRITICAL)
-    try:
-        yield
-    finally:
-        logging.disable(old_level)
+    from fanficfare import geturls
+
+    logging.getLogger("fanficfare").setLevel(logging.CRITICAL)
+    return geturls
 
 
 class EmailInfo:
@@ -85,10 +74,9 @@ class EmailInfo:
         Args:
             toml_path (str): The path to the TOML configuration file.
         """
-        # Open the TOML configuration file in binary mode
-        with open(toml_path, "rb") as file:
-            # Load the configuration from the TOML file
-            config = tomllib.load(file)
+        # Load the configuration from the TOML file, shared with the other
+        # objects built from the same file
+        config = system_utils.load_toml(toml_path)
         # Retrieve the 'email' section from the loaded configuration
         email_config = config.get("email", {})
         # Set the email address from the configuration
@@ -109,9 +97,10 @@ class EmailInfo:
         Returns:
             set[str]: A set of URLs found in the emails.
         """
+        geturls = load_geturls()
         urls = set()
 
-        with set_timeout(55), suppress_logging():
+        with set_timeout(55):
             try:
                 urls = geturls.get_urls_from_imap(
                     self.server, self.email, self.password, self.mailbox
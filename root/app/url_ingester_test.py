@@ -1,8 +1,9 @@
 from parameterized import parameterized
+import logging
 import unittest
 from unittest.mock import mock_open, patch
 
-from url_ingester import EmailInfo
+from url_ingester import EmailInfo, load_geturls
 
 
 class TestUrlIngester(unittest.TestCase):
@@ -98,7 +99,7 @@ class TestUrlIngester(unittest.TestCase):
             ),
         ]
     )
-    @patch("url_ingester.geturls.get_urls_from_imap")
+    @patch("fanficfare.geturls.get_urls_from_imap")
     @patch("builtins.open", new_callable=mock_open)
     def test_email_info_get_urls(
         self, config, expected_config, urls, mock_file, mock_get_urls_from_imap
@@ -115,6 +116,14 @@ class TestUrlIngester(unittest.TestCase):
         )
         self.assertEqual(result, urls)
 
+    def test_load_geturls_suppresses_fanficfare_logging(self):
+        # FanFicFare's module loggers inherit the level set after the import
+        load_geturls()
+        self.assertEqual(
+            logging.getLogger("fanficfare.geturls").getEffectiveLevel(),
+            logging.CRITICAL,
+        )
+
 
 if __name__ == "__main__":
     unittest.main()
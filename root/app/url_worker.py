@@ -1,6 +1,5 @@
 import multiprocessing as mp
 from subprocess import check_output, PIPE, STDOUT
-from time import sleep
 
 import calibre_info
 import calibredb_utils
@@ -97,20 +96,22 @@ def get_path_or_url(
     return ff_info.url
 
 
-def execute_command(command: str) -> str:
+def execute_command(command: str, cwd: str = None) -> str:
     """
     Executes a shell command and returns its output.
 
     Args:
         command (str): The command to execute.
+        cwd (str, optional): The working directory to run the command in.
+            Defaults to None, which uses the current working directory.
 
     Returns:
         str: The output of the command.
     """
-    ff_logging.log_debug(f"\tExecuting command: {command}")
-    return check_output(command, shell=True, stderr=STDOUT, stdin=PIPE).decode(
-        "utf-8"
-    )
+    ff_logging.log_debug("\tExecuting command: %s", command)
+    return check_output(
+        command, shell=True, stderr=STDOUT, stdin=PIPE, cwd=cwd
+    ).decode("utf-8")
 
 
 def process_fanfic_addition(
@@ -207,13 +208,10 @@ def url_worker(
     Returns:
         None
     """
+    # Each pool worker prints its console output from a background thread
+    ff_logging.set_buffered(True)
     while True:
-        # Check if the queue is empty; if so, wait before checking again
-        if queue.empty():
-            sleep(5)
-            continue
-
-        # Retrieve the next fanfic object from the queue
+        # Block until the next fanfic object is available in the queue
         fanfic = queue.get()
         # If the retrieved item is None, skip to the next iteration
         if fanfic is None:
@@ -228,14 +226,14 @@ def url_worker(
             ff_logging.log(f"\t({site}) Updating {path_or_url}", "OKGREEN")
 
             # Construct the command for updating the fanfic with FanFicFare
-            command = f'cd {temp_dir} && python -m fanficfare.cli -u "{path_or_url}" --update-cover --non-interactive'
+            command = f'python -m fanficfare.cli -u "{path_or_url}" --update-cover --non-interactive'
             if fanfic.behavior == "force":
                 command += " --force"
 
             try:
                 # Copy necessary configuration files to the temporary directory and execute the update command
                 system_utils.copy_configs_to_temp_dir(cdb, temp_dir)
-                output = execute_command(command)
+                output = execute_command(command, cwd=temp_dir)
             except Exception as e:
                 # Log failure and handle it (e.g., by sending a notification or re-queuing the fanfic)
                 ff_logging.log_failure(
@@ -141,12 +141,19 @@ class TestUrlWorker(unittest.TestCase):
 
     class ExecuteCommandTestCase(NamedTuple):
         command: str
+        cwd: Optional[str]
         expected_output: str
 
     @parameterized.expand(
         [
             ExecuteCommandTestCase(
                 command="echo Hello",
+                cwd=None,
+                expected_output="Hello",
+            ),
+            ExecuteCommandTestCase(
+                command="echo Hello",
+                cwd="/fake/temp/dir",
                 expected_output="Hello",
             ),
         ]
@@ -155,6 +162,7 @@ class TestUrlWorker(unittest.TestCase):
     def test_execute_command(
         self,
         command,
+        cwd,
         expected_output,
         mock_check_output,
     ):
@@ -162,12 +170,12 @@ class TestUrlWorker(unittest.TestCase):
         mock_check_output.return_value = expected_output.encode("utf-8")
 
         # Execution
-        result = url_worker.execute_command(command)
+        result = url_worker.execute_command(command, cwd=cwd)
 
         # Assertions
         self.assertEqual(result.strip(), expected_output)
         mock_check_output.assert_called_once_with(
-            command, shell=True, stderr=STDOUT, stdin=PIPE
+            command, shell=True, stderr=STDOUT, stdin=PIPE, cwd=cwd
         )
 
     class ProcessFanficAdditionTestCase(NamedTuple):